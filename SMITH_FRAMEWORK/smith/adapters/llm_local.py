@@ -6,7 +6,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LocalLLMConfig:
     """Configuration for the local model."""
 
@@ -19,11 +19,15 @@ class LocalLLM:
 
     def __init__(self, config: LocalLLMConfig) -> None:
         self._config = config
+        self._prefix = f"[local-llm:{config.model_path}] "
+        self._max_tokens = config.max_tokens
 
     def generate(self, prompt: str, *, stop: Iterable[str] | None = None) -> str:
-        """Generate a response for the prompt."""
+        """Generate a response for the prompt.
 
-        del stop  # placeholder for future logic
-        prefix = f"[local-llm:{self._config.model_path}] "
-        response = f"{prefix}{prompt}"
-        return response[: self._config.max_tokens]
+        *stop* is accepted for interface compatibility and currently ignored.
+        """
+
+        if len(self._prefix) + len(prompt) <= self._max_tokens:
+            return self._prefix + prompt
+        return (self._prefix + prompt)[: self._max_tokens]
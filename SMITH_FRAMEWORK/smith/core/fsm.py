@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 
 from smith.utils.errors import SmithError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     """A logical state within the SMITH agent."""
 
@@ -16,7 +17,7 @@ class State:
     description: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Transition:
     """Describes an allowed transition between two states."""
 
@@ -35,17 +36,23 @@ class FiniteStateMachine:
         *,
         initial: State,
     ) -> None:
-        self._states = {state.name: state for state in states}
+        # Interned keys are the same objects as identifier-like string literals,
+        # so probes with such literals match on identity. Names passed to
+        # can_transition/transition are deliberately not interned.
+        self._states = {sys.intern(state.name): state for state in states}
         if initial.name not in self._states:
             raise SmithError(f"Initial state '{initial.name}' is not registered")
-        self._transitions: dict[str, list[Transition]] = {}
+        self._transitions: dict[str, dict[str, list[Transition]]] = {}
         for transition in transitions:
             if (
                 transition.source.name not in self._states
                 or transition.target.name not in self._states
             ):
                 raise SmithError("Transitions must reference known states")
-            self._transitions.setdefault(transition.source.name, []).append(transition)
+            source = sys.intern(transition.source.name)
+            target = sys.intern(transition.target.name)
+            by_target = self._transitions.setdefault(source, {})
+            by_target.setdefault(target, []).append(transition)
         self._current: State = initial
 
     @property
@@ -57,10 +64,11 @@ class FiniteStateMachine:
     def can_transition(self, target: str) -> bool:
         """Check whether a transition to *target* is allowed."""
 
-        for transition in self._transitions.get(self._current.name, []):
-            if transition.target.name == target and (
-                transition.guard is None or transition.guard(self)
-            ):
+        by_target = self._transitions.get(self._current.name)
+        if by_target is None:
+            return False
+        for transition in by_target.get(target, ()):
+            if transition.guard is None or transition.guard(self):
                 return True
         return False
 
@@ -6,7 +6,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryRecord:
     """A unit of contextual data stored by the agent."""
 
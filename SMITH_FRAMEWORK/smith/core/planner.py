@@ -10,14 +10,14 @@ from smith.core.memory import MemoryStore
 from smith.utils.errors import SmithError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Goal:
     """Represents a user goal or task statement."""
 
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanStep:
     """A step in an execution plan."""
 
@@ -11,6 +11,8 @@ from smith.utils.errors import SmithError
 class Registry[T]:
     """A minimal in-memory registry keyed by name."""
 
+    __slots__ = ("_name", "_entries")
+
     def __init__(self, *, name: str) -> None:
         self._name = name
         self._entries: dict[str, T] = {}
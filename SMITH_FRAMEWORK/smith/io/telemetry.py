@@ -2,17 +2,112 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import math
 import sys
-from collections.abc import Mapping
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+import threading
+import time
+import traceback
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import UTC, date, datetime, timedelta
+from datetime import time as datetime_time
+from enum import Enum
 from pathlib import Path
 from typing import Any, TextIO
+from uuid import UUID
 
 _EVENT_CODE_MIN = 100
 _EVENT_CODE_MAX = 999
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _json_default(value: object) -> Any:
+    """Convert the non-JSON types telemetry payloads may carry.
+
+    Shared by both encoders so they accept exactly the same types.
+    """
+
+    if isinstance(value, date | datetime_time):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return {item.name: getattr(value, item.name) for item in fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(body: dict[str, Any]) -> str:
+    try:
+        return _encode_stdlib(body)
+    except ValueError as error:
+        # Match orjson, which writes non-finite floats as null.
+        try:
+            normalized = _replace_non_finite(body)
+        except RecursionError:
+            raise error from None
+        return _encode_stdlib(normalized)
+
+
+def _encode_stdlib(value: Any) -> str:
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+        default=_json_default,
+    )
+
+
+def _replace_non_finite(value: Any) -> Any:
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, Mapping):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_replace_non_finite(item) for item in value]
+    if isinstance(value, Enum) or (is_dataclass(value) and not isinstance(value, type)):
+        return _replace_non_finite(_json_default(value))
+    return value
+
+
+def _load_dumps() -> Callable[[dict[str, Any]], str]:
+    """Prefer orjson when installed; fall back to the stdlib encoder.
+
+    Both encoders accept the same types via ``_json_default`` and write
+    non-finite floats as null. Bodies orjson rejects (non-str keys, integers
+    wider than 64 bits, unsupported types) are re-encoded by the stdlib path,
+    so they serialize or raise TypeError the same way on both. The one
+    remaining difference is float exponent spelling: orjson writes ``1e-7``
+    where json writes ``1e-07``; both parse to the same value.
+    """
+
+    try:
+        import orjson
+    except ImportError:
+        return _stdlib_dumps
+
+    # Route dates and dataclasses through _json_default like the stdlib path.
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def _orjson_dumps(body: dict[str, Any]) -> str:
+        try:
+            return orjson.dumps(
+                body,
+                default=_json_default,
+                option=options,
+            ).decode()
+        except orjson.JSONEncodeError:
+            return _stdlib_dumps(body)
+
+    return _orjson_dumps
+
+
+_dumps = _load_dumps()
 
 
 @dataclass(slots=True)
@@ -23,22 +118,30 @@ class TelemetryEvent:
     message: str
     severity: str = "info"
     payload: Mapping[str, Any] | None = None
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    def __post_init__(self) -> None:
+        if not (_EVENT_CODE_MIN <= self.code <= _EVENT_CODE_MAX):
+            raise ValueError("Event code must be within 100-999")
+
+    @property
+    def timestamp(self) -> datetime:
+        """Return the event time as a timezone-aware UTC datetime."""
+
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
 
     def to_json(self) -> str:
         """Serialize the event to a JSON string."""
 
-        if not (_EVENT_CODE_MIN <= self.code <= _EVENT_CODE_MAX):
-            raise ValueError("Event code must be within 100-999")
-        body = {
-            "ts": self.timestamp.isoformat(),
+        body: dict[str, Any] = {
+            "ts": self.timestamp,
             "code": self.code,
             "severity": self.severity,
             "message": self.message,
         }
         if self.payload:
             body["payload"] = dict(self.payload)
-        return json.dumps(body, ensure_ascii=False)
+        return _dumps(body)
 
 
 class JSONTelemetryLogger:
@@ -54,6 +157,98 @@ class JSONTelemetryLogger:
         self._logger.log(_map_severity(event.severity), serialized)
 
 
+class BufferedTelemetryLogger:
+    """Write telemetry events straight to a stream, flushing in batches.
+
+    Bypasses the logging framework (and therefore level filtering) for
+    high-volume runs. Pending events are flushed on :meth:`close`, when
+    leaving a ``with`` block, or at interpreter exit.
+    """
+
+    def __init__(self, stream: TextIO, *, flush_interval: float = 0.1) -> None:
+        if not flush_interval > 0:
+            raise ValueError("flush_interval must be positive")
+        self._stream = stream
+        self._flush_interval = flush_interval
+        self._buffer: list[str] = []
+        # _buffer_lock only guards the list swap so emit() never waits on I/O;
+        # _write_lock serializes writes so batches reach the stream in order.
+        self._buffer_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="smith-telemetry-flush",
+            daemon=True,
+        )
+        self._flusher.start()
+        atexit.register(self.close)
+
+    def __enter__(self) -> BufferedTelemetryLogger:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def emit(self, event: TelemetryEvent) -> None:
+        """Queue the serialized event for the next flush."""
+
+        line = event.to_json() + "\n"
+        with self._buffer_lock:
+            if self._closed:
+                raise ValueError("Telemetry logger is closed")
+            self._buffer.append(line)
+
+    def flush(self) -> None:
+        """Write all pending events to the stream.
+
+        On a write error the pending batch is dropped, reported on stderr
+        and the error is re-raised.
+        """
+
+        with self._write_lock:
+            with self._buffer_lock:
+                pending, self._buffer = self._buffer, []
+            if not pending:
+                return
+            try:
+                self._stream.write("".join(pending))
+                self._stream.flush()
+            except Exception:
+                _report_flush_error(len(pending))
+                raise
+
+    def close(self) -> None:
+        """Stop the background flusher and write remaining events."""
+
+        with self._buffer_lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.close)
+        self._stop.set()
+        self._flusher.join()
+        self.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # Already reported by flush(); keep flushing later batches.
+                continue
+
+
+def _report_flush_error(dropped: int) -> None:
+    try:
+        sys.stderr.write(f"--- Telemetry flush error: dropped {dropped} event(s) ---\n")
+        traceback.print_exc(file=sys.stderr)
+    except OSError:
+        # stderr itself is unusable; nothing left to report to.
+        pass
+
+
 def _map_severity(severity: str) -> int:
     levels = {
         "debug": logging.DEBUG,
@@ -18,10 +18,10 @@ class AllowListPolicy(ExecutionPolicy):
     """Allow commands based on an allow-list."""
 
     def __init__(self, allowed_binaries: Sequence[str]) -> None:
-        self._allowed = set(allowed_binaries)
+        self._allowed = frozenset(allowed_binaries)
 
     def is_allowed(self, command: Sequence[str]) -> bool:
-        return False if not command else command[0] in self._allowed
+        return bool(command) and command[0] in self._allowed
 
 
 class DenyAllPolicy(ExecutionPolicy):
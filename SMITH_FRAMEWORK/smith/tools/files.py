@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from smith.utils.errors import SmithError
@@ -12,15 +13,19 @@ class FilesTool:
 
     def __init__(self, root: Path) -> None:
         self._root = root.resolve()
+        self._root_str = str(self._root)
+        self._root_prefix = os.path.join(self._root_str, "")
+        self._root_depth = len(self._root.parts)
 
     def _resolve(self, relative_path: str) -> Path:
         target = (self._root / relative_path).resolve()
-        try:
-            target.relative_to(self._root)
-        except ValueError as error:
-            raise SmithError("Attempt to escape sandbox root") from error
+        target_str = str(target)
+        if target_str != self._root_str and not target_str.startswith(
+            self._root_prefix
+        ):
+            raise SmithError("Attempt to escape sandbox root")
         current = self._root
-        for part in target.relative_to(self._root).parts:
+        for part in target.parts[self._root_depth :]:
             current = current / part
             if current.is_symlink():
                 raise SmithError(f"Symlink detected in sandbox path: {current}")
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+import locale
 import shlex
 import subprocess
+import sys
 from collections.abc import Sequence
 from pathlib import Path
+from typing import cast
 
 from smith.runtime.policies import ExecutionPolicy
 from smith.utils.errors import SmithError
@@ -26,17 +30,9 @@ class ShellTool:
     ) -> subprocess.CompletedProcess[str]:
         """Run a command inside the sandbox."""
 
-        if isinstance(command, str):
-            command_args = shlex.split(command)
-        else:
-            command_args = [str(part) for part in command]
-        if not command_args:
-            raise SmithError("Shell command cannot be empty")
-        command_tuple = tuple(command_args)
-        if not self._policy.is_allowed(command_tuple):
-            raise SmithError("Command is rejected by the execution policy")
+        command_args = self._prepare(command)
         return subprocess.run(
-            command_tuple,
+            command_args,
             capture_output=True,
             cwd=self._sandbox_root,
             text=True,
@@ -44,3 +40,54 @@ class ShellTool:
             check=False,
             shell=False,
         )
+
+    async def run_async(
+        self,
+        command: Sequence[str] | str,
+        *,
+        timeout: float = 60.0,
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a command inside the sandbox without blocking the event loop."""
+
+        command_args = self._prepare(command)
+        process = await asyncio.create_subprocess_exec(
+            *command_args,
+            cwd=self._sandbox_root,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except BaseException as error:
+            # Covers timeouts and task cancellation: never leave the child running.
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            if isinstance(error, TimeoutError):
+                raise subprocess.TimeoutExpired(command_args, timeout) from error
+            raise
+        return subprocess.CompletedProcess(
+            command_args,
+            # communicate() only returns once the child has been reaped.
+            cast(int, process.returncode),
+            stdout=_decode_output(stdout),
+            stderr=_decode_output(stderr),
+        )
+
+    def _prepare(self, command: Sequence[str] | str) -> list[str]:
+        if isinstance(command, str):
+            command_args = shlex.split(command)
+        else:
+            command_args = [str(part) for part in command]
+        if not command_args:
+            raise SmithError("Shell command cannot be empty")
+        if not self._policy.is_allowed(command_args):
+            raise SmithError("Command is rejected by the execution policy")
+        return command_args
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode child output the way ``subprocess.run(..., text=True)`` does."""
+
+    encoding = "utf-8" if sys.flags.utf8_mode else locale.getencoding()
+    return data.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
@@ -0,0 +1,78 @@
+"""Tests for the sandboxed files tool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from smith.tools.files import FilesTool
+from smith.utils.errors import SmithError
+
+
+@pytest.fixture
+def sandbox(tmp_path: Path) -> Path:
+    root = tmp_path / "sb"
+    root.mkdir()
+    return root
+
+
+def test_read_and_write_stay_inside_root(sandbox: Path) -> None:
+    """Relative paths, including ones that step back in, resolve under root."""
+
+    tool = FilesTool(sandbox)
+    tool.write("nested/dir/../note.txt", "hello")
+
+    assert (sandbox / "nested" / "note.txt").read_text(encoding="utf-8") == "hello"
+    assert tool.read("nested/note.txt") == "hello"
+
+
+def test_empty_path_resolves_to_root(sandbox: Path) -> None:
+    """The root itself is inside the sandbox."""
+
+    assert FilesTool(sandbox)._resolve("") == sandbox.resolve()
+
+
+@pytest.mark.parametrize("path", ["..", "../outside.txt", "a/../../outside.txt"])
+def test_parent_traversal_is_rejected(sandbox: Path, path: str) -> None:
+    """'..' segments cannot climb above the root."""
+
+    with pytest.raises(SmithError, match="escape sandbox root"):
+        FilesTool(sandbox)._resolve(path)
+
+
+def test_absolute_path_is_rejected(sandbox: Path) -> None:
+    """Absolute paths replace the root when joined and must be refused."""
+
+    with pytest.raises(SmithError, match="escape sandbox root"):
+        FilesTool(sandbox).read("/etc/passwd")
+
+
+def test_sibling_sharing_root_prefix_is_rejected(sandbox: Path) -> None:
+    """'<root>2' shares the root's string prefix but lies outside it."""
+
+    sibling = sandbox.parent / "sb2"
+    sibling.mkdir()
+    (sibling / "f").write_text("secret", encoding="utf-8")
+
+    with pytest.raises(SmithError, match="escape sandbox root"):
+        FilesTool(sandbox).read("../sb2/f")
+
+
+def test_symlink_out_of_root_is_rejected(sandbox: Path) -> None:
+    """Directory and file symlinks pointing outside the root are refused."""
+
+    outside = sandbox.parent / "outside"
+    outside.mkdir()
+    (outside / "f").write_text("secret", encoding="utf-8")
+    (sandbox / "dir-link").symlink_to(outside, target_is_directory=True)
+    (sandbox / "file-link").symlink_to(outside / "f")
+    tool = FilesTool(sandbox)
+
+    with pytest.raises(SmithError, match="escape sandbox root"):
+        tool.read("dir-link/f")
+    with pytest.raises(SmithError, match="escape sandbox root"):
+        tool.read("file-link")
+    with pytest.raises(SmithError, match="escape sandbox root"):
+        tool.write("dir-link/new.txt", "x")
+    assert not (outside / "new.txt").exists()
@@ -0,0 +1,87 @@
+"""Tests for the SMITH finite state machine."""
+
+from __future__ import annotations
+
+import pytest
+
+from smith.core.fsm import FiniteStateMachine, State, Transition
+from smith.utils.errors import SmithError
+
+IDLE = State(name="idle")
+EXECUTING = State(name="executing")
+DONE = State(name="done")
+FAILED = State(name="failed")
+
+
+def _machine(*transitions: Transition) -> FiniteStateMachine:
+    return FiniteStateMachine(
+        states=[IDLE, EXECUTING, DONE, FAILED],
+        transitions=transitions,
+        initial=IDLE,
+    )
+
+
+def test_can_transition_looks_up_target_from_current_state() -> None:
+    """Only targets registered for the current state are reachable."""
+
+    machine = _machine(
+        Transition(source=IDLE, target=EXECUTING),
+        Transition(source=EXECUTING, target=DONE),
+    )
+
+    assert machine.can_transition("executing")
+    assert not machine.can_transition("done")
+    assert not machine.can_transition("unknown")
+
+    machine.transition("executing")
+
+    assert machine.current is EXECUTING
+    assert machine.can_transition("done")
+    assert not machine.can_transition("executing")
+
+
+def test_state_without_outgoing_transitions_allows_nothing() -> None:
+    """A terminal state rejects every target."""
+
+    machine = _machine(Transition(source=IDLE, target=DONE))
+    machine.transition("done")
+
+    assert not machine.can_transition("idle")
+    with pytest.raises(SmithError, match="Invalid transition from done to idle"):
+        machine.transition("idle")
+
+
+def test_guards_are_evaluated_against_the_machine() -> None:
+    """A failing guard blocks the transition; a later passing one allows it."""
+
+    seen: list[FiniteStateMachine] = []
+
+    def deny(machine: FiniteStateMachine) -> bool:
+        seen.append(machine)
+        return False
+
+    blocked = _machine(Transition(source=IDLE, target=FAILED, guard=deny))
+    assert not blocked.can_transition("failed")
+    assert seen == [blocked]
+    with pytest.raises(SmithError):
+        blocked.transition("failed")
+    assert blocked.current is IDLE
+
+    allowed = _machine(
+        Transition(source=IDLE, target=FAILED, guard=deny),
+        Transition(source=IDLE, target=FAILED, guard=lambda machine: True),
+    )
+    assert allowed.transition("failed") is FAILED
+
+
+def test_constructor_rejects_unknown_states() -> None:
+    """Initial states and transition endpoints must be registered."""
+
+    with pytest.raises(SmithError, match="Initial state 'other'"):
+        FiniteStateMachine(states=[IDLE], transitions=[], initial=State("other"))
+    with pytest.raises(SmithError, match="known states"):
+        FiniteStateMachine(
+            states=[IDLE],
+            transitions=[Transition(source=IDLE, target=DONE)],
+            initial=IDLE,
+        )
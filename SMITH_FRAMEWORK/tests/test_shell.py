@@ -0,0 +1,92 @@
+"""Tests for the shell tool adapter."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from smith.runtime.policies import AllowListPolicy
+from smith.tools.shell import ShellTool
+
+_SLEEP_FOREVER = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+def _tool(root: Path) -> ShellTool:
+    return ShellTool(sandbox_root=root, policy=AllowListPolicy([sys.executable]))
+
+
+def _spy_on_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[asyncio.subprocess.Process]:
+    """Record every process spawned through asyncio.create_subprocess_exec."""
+
+    spawned: list[asyncio.subprocess.Process] = []
+    original = asyncio.create_subprocess_exec
+
+    async def _spawn(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+        process = await original(*args, **kwargs)
+        spawned.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _spawn)
+    return spawned
+
+
+def test_run_async_matches_run_output(tmp_path: Path) -> None:
+    """run_async returns the same CompletedProcess fields as run."""
+
+    tool = _tool(tmp_path)
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; sys.stdout.buffer.write(b'a\\r\\nb'); "
+        "sys.stderr.write('err'); sys.exit(3)",
+    ]
+
+    expected = tool.run(command)
+    result = asyncio.run(tool.run_async(command))
+
+    assert result.args == expected.args
+    assert result.returncode == expected.returncode == 3
+    assert result.stdout == expected.stdout == "a\nb"
+    assert result.stderr == expected.stderr == "err"
+
+
+def test_run_async_timeout_kills_child(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A timeout raises TimeoutExpired and reaps the child."""
+
+    spawned = _spy_on_processes(monkeypatch)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(_tool(tmp_path).run_async(_SLEEP_FOREVER, timeout=0.2))
+
+    assert len(spawned) == 1
+    assert spawned[0].returncode is not None
+
+
+def test_run_async_cancellation_kills_child(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cancelling the awaiting task reaps the child instead of orphaning it."""
+
+    spawned = _spy_on_processes(monkeypatch)
+
+    async def _cancel_midway() -> None:
+        task = asyncio.create_task(_tool(tmp_path).run_async(_SLEEP_FOREVER))
+        while not spawned:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_cancel_midway())
+
+    assert len(spawned) == 1
+    assert spawned[0].returncode is not None
@@ -0,0 +1,230 @@
+"""Tests for SMITH telemetry."""
+
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from datetime import time as datetime_time
+from enum import Enum, IntEnum
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from smith.io import telemetry
+from smith.io.telemetry import BufferedTelemetryLogger, TelemetryEvent
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+class _Level(IntEnum):
+    HIGH = 3
+
+
+@dataclass
+class _Step:
+    name: str
+    due: date
+    score: float
+
+
+def _encode_with_both(
+    payload: dict[Any, Any], monkeypatch: pytest.MonkeyPatch
+) -> tuple[str, str]:
+    pytest.importorskip("orjson")
+    orjson_dumps = telemetry._load_dumps()
+    assert orjson_dumps is not telemetry._stdlib_dumps
+    event = TelemetryEvent(
+        code=200,
+        message="plan-generated",
+        payload=payload,
+        timestamp_ns=1_760_000_000_123_456_789,
+    )
+
+    monkeypatch.setattr(telemetry, "_dumps", orjson_dumps)
+    from_orjson = event.to_json()
+    monkeypatch.setattr(telemetry, "_dumps", telemetry._stdlib_dumps)
+    from_stdlib = event.to_json()
+    return from_orjson, from_stdlib
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"goal": "Исследовать задачу", "steps": ["analyze_goal", "execute_plan"]},
+        {1: "int key", 2.5: "float key", None: "null key", "nested": {3: (4, 5)}},
+        {"nan": float("nan"), "inf": [float("inf"), -float("inf")], "ok": 0.1},
+        {"wide": 2**70, "narrow": -(2**63)},
+        {"id": UUID(int=5), "color": _Color.RED, "level": _Level.HIGH},
+        {"day": date(2025, 10, 9), "at": datetime_time(8, 53, 20, 5)},
+        {"step": _Step(name="run", due=date(2025, 1, 2), score=float("nan"))},
+    ],
+)
+def test_orjson_and_stdlib_encoders_agree(
+    payload: dict[Any, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Telemetry output does not depend on which JSON encoder is active."""
+
+    from_orjson, from_stdlib = _encode_with_both(payload, monkeypatch)
+
+    assert from_orjson == from_stdlib
+    assert json.loads(from_stdlib)["ts"] == "2025-10-09T08:53:20.123456+00:00"
+
+
+def test_encoders_agree_on_small_float_values(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Exponent spelling may differ (1e-7 vs 1e-07) but values are equal."""
+
+    payload = {"tiny": [1e-7, 2.5e-9, 1e-5], "huge": 1.5e300, "plain": 0.1}
+
+    from_orjson, from_stdlib = _encode_with_both(payload, monkeypatch)
+
+    assert json.loads(from_orjson) == json.loads(from_stdlib)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{"opaque": object()}, {date(2025, 1, 1): "date key"}, {"ids": {1, 2}}],
+)
+def test_encoders_reject_the_same_payloads(
+    payload: dict[Any, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Unsupported values and keys raise TypeError whichever encoder runs."""
+
+    pytest.importorskip("orjson")
+    event = TelemetryEvent(code=200, message="m", payload=payload)
+    for dumps in (telemetry._load_dumps(), telemetry._stdlib_dumps):
+        monkeypatch.setattr(telemetry, "_dumps", dumps)
+        with pytest.raises(TypeError):
+            event.to_json()
+
+
+class _RecordingStream(io.StringIO):
+    """StringIO that records each write call separately."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[str] = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return super().write(text)
+
+
+class _FailingOnceStream(_RecordingStream):
+    """Stream whose first write raises OSError."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.failed = False
+
+    def write(self, text: str) -> int:
+        if not self.failed:
+            self.failed = True
+            raise OSError("disk full")
+        return super().write(text)
+
+
+def _wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            pytest.fail("condition not met before timeout")
+        time.sleep(0.01)
+
+
+def test_buffered_logger_batches_events_into_one_write() -> None:
+    """Events emitted between flushes reach the stream in a single write."""
+
+    stream = _RecordingStream()
+    logger = BufferedTelemetryLogger(stream, flush_interval=60.0)
+    for code in (100, 101, 102):
+        logger.emit(TelemetryEvent(code=code, message="m"))
+    assert stream.writes == []
+
+    logger.flush()
+
+    assert len(stream.writes) == 1
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["code"] for line in lines] == [100, 101, 102]
+    logger.close()
+
+
+def test_buffered_logger_close_flushes_pending_events() -> None:
+    """close() writes everything emitted before it."""
+
+    stream = _RecordingStream()
+    with BufferedTelemetryLogger(stream, flush_interval=60.0) as logger:
+        logger.emit(TelemetryEvent(code=100, message="first"))
+        logger.emit(TelemetryEvent(code=200, message="second"))
+
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 2
+    assert '"message":"first"' in lines[0]
+    assert '"message":"second"' in lines[1]
+
+
+def test_buffered_logger_rejects_emit_after_close() -> None:
+    """Emitting into a closed logger raises instead of dropping the event."""
+
+    logger = BufferedTelemetryLogger(_RecordingStream(), flush_interval=60.0)
+    logger.close()
+    logger.close()
+
+    with pytest.raises(ValueError, match="closed"):
+        logger.emit(TelemetryEvent(code=100, message="late"))
+
+
+@pytest.mark.parametrize("interval", [0.0, -1.0, float("nan")])
+def test_buffered_logger_rejects_non_positive_interval(interval: float) -> None:
+    """A zero or negative interval would make the flusher spin."""
+
+    with pytest.raises(ValueError, match="flush_interval"):
+        BufferedTelemetryLogger(_RecordingStream(), flush_interval=interval)
+
+
+def test_buffered_logger_keeps_flushing_after_write_error(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """A failed periodic write is reported and later batches still land."""
+
+    stream = _FailingOnceStream()
+    logger = BufferedTelemetryLogger(stream, flush_interval=0.01)
+    logger.emit(TelemetryEvent(code=100, message="lost"))
+    _wait_for(lambda: stream.failed)
+
+    logger.emit(TelemetryEvent(code=200, message="kept"))
+    _wait_for(lambda: "kept" in stream.getvalue())
+    logger.close()
+
+    assert "lost" not in stream.getvalue()
+    assert "dropped 1 event(s)" in capsys.readouterr().err
+
+
+def test_buffered_logger_flushes_at_interpreter_exit() -> None:
+    """Events are written even if the owner never calls close()."""
+
+    script = (
+        "import sys\n"
+        "from smith.io.telemetry import BufferedTelemetryLogger, TelemetryEvent\n"
+        "logger = BufferedTelemetryLogger(sys.stdout, flush_interval=60.0)\n"
+        "logger.emit(TelemetryEvent(code=900, message='bye'))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+
+    assert '"message":"bye"' in result.stdout